@@ -163,6 +163,10 @@ class PavilionConfigLoader(yc.YamlConfigLoader):
             help_text="Maximum simultaneous builds. Note that each build may "
                       "itself spawn off threads/processes, so it's probably "
                       "reasonable to keep this at just a few."),
+        yc.IntRangeElem(
+            "io_threads", default=8, vmin=1,
+            help_text="Maximum threads to use for IO bound tasks, such as "
+                      "loading test runs or linking them into a series."),
         yc.StrElem(
             "log_format",
             default="{asctime}, {levelname}, {hostname}, {name}: {message}",
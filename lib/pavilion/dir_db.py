@@ -73,11 +73,9 @@ def create_id_dir(id_dir: Path) -> (int, Path):
             # If the next file's id wasn't valid, then find the next available
             # id directory the hard way.
 
-            ids = list(os.listdir(str(id_dir)))
-            # Only return the test directories that could be integers.
-            ids = [id_ for id_ in ids if id_.isdigit()]
-            ids = [int(id_) for id_ in ids]
-            ids.sort()
+            # Only consider the test directories that could be integers.
+            ids = {int(id_) for id_ in os.listdir(str(id_dir))
+                   if id_.isdigit()}
 
             # Find the first unused id.
             next_id = 1
@@ -117,8 +115,13 @@ def select(id_dir: Path,
     Other arguments are as per select_from.
     """
 
-    return select_from(
-        paths=id_dir.iterdir(),
+    # The DirEntry objects from scandir already know their file type, which
+    # saves a stat call per directory (except for symlinks).
+    paths = [Path(entry.path) for entry in os.scandir(str(id_dir))
+             if entry.name.isdigit() and entry.is_dir()]
+
+    return _select(
+        paths=paths,
         transform=transform,
         filter_func=filter_func,
         order_func=order_func,
@@ -149,11 +152,31 @@ def select_from(paths: Iterable[Path],
     :returns: A filtered, ordered list of transformed objects.
     """
 
+    paths = (path for path in paths
+             if path.name.isdigit() and path.is_dir())
+
+    return _select(
+        paths=paths,
+        transform=transform,
+        filter_func=filter_func,
+        order_func=order_func,
+        order_asc=order_asc,
+        limit=limit,
+    )
+
+
+def _select(paths: Iterable[Path],
+            filter_func: Callable[[Any], bool],
+            transform: Callable[[Path], Any],
+            order_func: Callable[[Any], Any],
+            order_asc: bool,
+            limit: int) -> List[Any]:
+    """Transform, filter, order, and limit the given id directory paths,
+    which are assumed to already be valid. Arguments are as per select_from.
+    """
+
     items = []
     for path in paths:
-        if not (path.name.isdigit() and path.is_dir()):
-            continue
-
         try:
             item = transform(path)
         except ValueError:
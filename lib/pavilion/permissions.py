@@ -1,6 +1,7 @@
 import grp
 import logging
 import os
+import threading
 import time
 from pathlib import Path
 from typing import Union
@@ -14,8 +15,15 @@ class PermissionsManager:
 
     Final file permissions will be the owner permissions applied to both
     group and other, and then masked.
+
+    The process umask is shared by all threads, so it's only changed by the
+    outermost active manager, and restored when the last one exits.
     """
 
+    _umask_lock = threading.Lock()
+    _umask_depth = 0
+    _orig_umask = None
+
     def __init__(self, path: Union[Path, str],
                  group: Union[str, None], umask: Union[int, None],
                  silent: bool = True):
@@ -34,7 +42,6 @@ class PermissionsManager:
         self.umask = umask
         self.path = Path(path)
         self.silent = silent
-        self._orig_umask = None
 
         self.logger = logging.getLogger(__name__)
 
@@ -43,7 +50,11 @@ class PermissionsManager:
         restored on exit."""
 
         if self.umask is not None:
-            self._orig_umask = os.umask(0o077)
+            cls = type(self)
+            with cls._umask_lock:
+                if cls._umask_depth == 0:
+                    cls._orig_umask = os.umask(0o077)
+                cls._umask_depth += 1
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Recursively set the group of all files to the given group, and
@@ -75,8 +86,13 @@ class PermissionsManager:
             if not self.silent:
                 raise
 
-        if self.umask is not None:
-            os.umask(self._orig_umask)
+        finally:
+            if self.umask is not None:
+                cls = type(self)
+                with cls._umask_lock:
+                    cls._umask_depth -= 1
+                    if cls._umask_depth == 0:
+                        os.umask(cls._orig_umask)
 
     def set_perms(self, path: Path) -> None:
         """Set the permissions for path.
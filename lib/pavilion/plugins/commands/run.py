@@ -1,11 +1,13 @@
 """The run command resolves tests by their names, builds them, and runs them."""
 
 import errno
+import itertools
 import pathlib
+import queue
 import threading
 import time
 from collections import defaultdict
-from typing import List, Union
+from typing import List
 
 from pavilion import commands
 from pavilion import output
@@ -133,7 +135,7 @@ class RunCommand(commands.Command):
         if tests_by_sched is None:
             return errno.EINVAL
 
-        all_tests = sum(tests_by_sched.values(), [])
+        all_tests = list(itertools.chain(*tests_by_sched.values()))
         self.last_tests = list(all_tests)
 
         if not all_tests:
@@ -195,7 +197,7 @@ class RunCommand(commands.Command):
         :return:
         """
 
-        all_tests = sum(tests_by_sched.values(), [])
+        all_tests = list(itertools.chain(*tests_by_sched.values()))
 
         for sched_name in tests_by_sched.keys():
             sched = schedulers.get_plugin(sched_name)
@@ -208,18 +210,18 @@ class RunCommand(commands.Command):
                 return errno.EINVAL
 
         for sched_name, tests in tests_by_sched.items():
-            tests = [test for test in tests if not test.skipped]
             sched = schedulers.get_plugin(sched_name)
 
-            # Filter out any 'build_only' tests (it should be all or none)
-            # that shouldn't be scheduled.
+            # Filter out skipped tests, and any 'build_only' tests (it should
+            # be all or none) that shouldn't be scheduled.
             tests = [test for test in tests if
-                     # The non-build only tests
-                     (not test.build_only) or
-                     # The build only tests that are built on nodes
-                     (not test.build_local and
-                      # As long they need to be built.
-                      (test.rebuild or not test.builder.exists()))]
+                     not test.skipped and (
+                         # The non-build only tests
+                         (not test.build_only) or
+                         # The build only tests that are built on nodes
+                         (not test.build_local and
+                          # As long they need to be built.
+                          (test.rebuild or not test.builder.exists())))]
 
             # Skip this scheduler if it doesn't have tests that need to run.
             if not tests:
@@ -348,7 +350,7 @@ name) of lists of tuples
 
         tests_by_sched = {}
         progress = 0
-        tot_tests = sum([len(tests) for tests in configs_by_sched.values()])
+        tot_tests = sum(len(tests) for tests in configs_by_sched.values())
 
         for sched_name in configs_by_sched.keys():
             tests_by_sched[sched_name] = []
@@ -399,15 +401,10 @@ name) of lists of tuples
 
             # Remove non-local builds when doing only local builds.
             if build_only and local_builds_only:
-                for sched in configs_by_sched:
-                    sched_cfgs = configs_by_sched[sched]
-                    for i in range(len(sched_cfgs)):
-                        config, _ = sched_cfgs[i]
-                        if config['build']['on_nodes'].lower() == 'true':
-                            sched_cfgs[i] = None
-                    sched_cfgs = [cfg for cfg in sched_cfgs
-                                  if cfg is not None]
-                    configs_by_sched[sched] = sched_cfgs
+                for sched, sched_cfgs in configs_by_sched.items():
+                    configs_by_sched[sched] = [
+                        (config, var_man) for config, var_man in sched_cfgs
+                        if config['build']['on_nodes'].lower() != 'true']
 
             tests_by_sched = self._configs_to_tests(
                 pav_cfg=pav_cfg,
@@ -481,7 +478,7 @@ name) of lists of tuples
         :param MultiBuildTracker mb_tracker: The tracker for all builds.
         """
 
-        test_threads = []   # type: List[Union[threading.Thread, None]]
+        test_threads = []   # type: List[threading.Thread]
         remote_builds = []
 
         cancel_event = threading.Event()
@@ -499,9 +496,12 @@ name) of lists of tuples
 
         # We don't want to start threads that are just going to wait on a lock,
         # so we'll rearrange the builds so that the uniq build names go first.
-        # We'll use this as a stack, so tests that should build first go at
-        # the end of the list.
-        build_order = []
+        # Tests that share a build name with an earlier test simply wait on
+        # that build, so they form a second 'level' that builds after the
+        # first. The result is used as a stack, so tests that should build
+        # first go at the end of the list.
+        uniq_builds = []
+        dup_builds = []
         # If we've seen a build name, the build can go later.
         seen_build_names = set()
 
@@ -509,10 +509,13 @@ name) of lists of tuples
             if not test.build_local:
                 remote_builds.append(test)
             elif test.builder.name not in seen_build_names:
-                build_order.append(test)
+                uniq_builds.append(test)
                 seen_build_names.add(test.builder.name)
             else:
-                build_order.insert(0, test)
+                dup_builds.append(test)
+
+        dup_builds.reverse()
+        build_order = dup_builds + uniq_builds
 
         # Keep track of what the last message printed per build was.
         # This is for double build verbosity.
@@ -527,47 +530,55 @@ name) of lists of tuples
                            state_len=STATES.max_length, state='State'),
                    'Message', file=self.outfile, width=None)
 
-        builds_running = 0
+        # Build threads report themselves here when they finish, so we can
+        # wake up as soon as a build completes rather than polling.
+        done_queue = queue.Queue()
+
         # Run and track <max_threads> build threads, giving output according
         # to the verbosity level. As threads finish, new ones are started until
         # either all builds complete or a build fails, in which case all tests
         # are aborted.
         while build_order or test_threads:
-            # Start a new thread if we haven't hit our limit.
-            if build_order and builds_running < max_threads:
+            # Start as many new threads as our limit allows.
+            while build_order and len(test_threads) < max_threads:
                 test = build_order.pop()
 
                 test_thread = threading.Thread(
-                    target=test.build,
-                    args=(cancel_event,)
+                    target=self._build_thread,
+                    args=(test, cancel_event, done_queue)
                 )
                 test_threads.append(test_thread)
                 test_by_threads[test_thread] = test
                 test_thread.start()
 
-            # Check if all our threads are alive, and join those that aren't.
-            for i in range(len(test_threads)):
-                thread = test_threads[i]
-                if not thread.is_alive():
-                    thread.join()
-                    builds_running -= 1
-                    test_threads[i] = None
-                    test = test_by_threads[thread]
-                    del test_by_threads[thread]
-
-                    # Only output test status after joining a thread.
-                    if build_verbosity == 1:
-                        notes = mb_tracker.get_notes(test.builder)
-                        when, state, msg = notes[-1]
-                        when = output.get_relative_timestamp(when)
-                        preamble = (self.BUILD_STATUS_PREAMBLE
-                                    .format(when=when, test_id=test.id,
-                                            state_len=STATES.max_length,
-                                            state=state))
-                        fprint(preamble, msg, wrap_indent=len(preamble),
-                               file=self.outfile, width=None)
-
-            test_threads = [thr for thr in test_threads if thr is not None]
+            # Block until a build finishes, but wake up periodically anyway
+            # to update our status output.
+            finished = []
+            try:
+                finished.append(
+                    done_queue.get(timeout=self.BUILD_SLEEP_TIME))
+                while True:
+                    finished.append(done_queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            # Join the finished threads.
+            for thread in finished:
+                thread.join()
+                test_threads.remove(thread)
+                test = test_by_threads.pop(thread)
+
+                # Only output test status after joining a thread.
+                if build_verbosity == 1:
+                    notes = mb_tracker.get_notes(test.builder)
+                    when, state, msg = notes[-1]
+                    when = output.get_relative_timestamp(when)
+                    preamble = (self.BUILD_STATUS_PREAMBLE
+                                .format(when=when, test_id=test.id,
+                                        state_len=STATES.max_length,
+                                        state=state))
+                    fprint(preamble, msg, wrap_indent=len(preamble),
+                           file=self.outfile, width=None)
 
             if cancel_event.is_set():
                 for thread in test_threads:
@@ -622,10 +633,24 @@ name) of lists of tuples
                                file=self.outfile, width=None)
                     message_counts[test.id] += len(msgs)
 
-            time.sleep(self.BUILD_SLEEP_TIME)
-
         if build_verbosity == 0:
             # Print a newline after our last status update.
             fprint(width=None, file=self.outfile)
 
         return 0
+
+    @staticmethod
+    def _build_thread(test, cancel_event, done_queue):
+        """Build the given test, then put the current thread on the done
+        queue (whether the build succeeded or not).
+
+        :param TestRun test: The test to build.
+        :param threading.Event cancel_event: Event to tell builds when to die.
+        :param queue.Queue done_queue: Where finished build threads are
+            reported.
+        """
+
+        try:
+            test.build(cancel_event)
+        finally:
+            done_queue.put(threading.current_thread())
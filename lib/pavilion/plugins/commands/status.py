@@ -4,6 +4,7 @@ other commands to print statuses."""
 import errno
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List
 
@@ -64,28 +65,49 @@ def status_from_test_obj(pav_cfg: dict, test: TestRun):
     }
 
 
+def _get_status(pav_cfg, test_id, err_note):
+    """Get the status for a single test id.
+
+    :param pav_cfg: The pavilion config.
+    :param int test_id: The test id to load.
+    :param str err_note: The status note to give (formatted with the error)
+        when the test can't be loaded.
+    :returns: Whether the test could be loaded, and its status dict.
+    """
+
+    try:
+        test = TestRun.load(pav_cfg, test_id)
+    except (TestRunError, TestRunNotFoundError) as err:
+        return False, {
+            'test_id': test_id,
+            'name':    "",
+            'state':   STATES.UNKNOWN,
+            'time':    None,
+            'note':    err_note.format(err),
+        }
+
+    return True, status_from_test_obj(pav_cfg, test)
+
+
+def _get_statuses(pav_cfg, test_ids, err_note):
+    """Get the status of each of the given tests, several at a time. See
+    _get_status for the arguments and return values."""
+
+    # Loading tests and querying their schedulers is almost entirely IO
+    # bound, so we do it for several tests at once.
+    with ThreadPoolExecutor(max_workers=pav_cfg.io_threads) as pool:
+        return list(pool.map(
+            lambda test_id: _get_status(pav_cfg, test_id, err_note),
+            test_ids))
+
+
 def get_test_statuses(pav_cfg, test_ids):
     """Return the statuses for all tests, up to the limit in args.limit.
     :param List[int] test_ids: A list of test ids to load.
     """
 
-    test_statuses = []
-
-    for test_id in test_ids:
-        try:
-            test = TestRun.load(pav_cfg, test_id)
-            test_statuses.append(status_from_test_obj(pav_cfg, test))
-
-        except (TestRunError, TestRunNotFoundError) as err:
-            test_statuses.append({
-                'test_id': test_id,
-                'name':    "",
-                'state':   STATES.UNKNOWN,
-                'time':    None,
-                'note':    "Test not found: {}".format(err)
-            })
-
-    return test_statuses
+    results = _get_statuses(pav_cfg, test_ids, "Test not found: {}")
+    return [stat for _, stat in results]
 
 
 def get_tests(pav_cfg, args, errfile):
@@ -144,25 +166,12 @@ def get_statuses(pav_cfg, args, errfile):
 """
 
     test_list = get_tests(pav_cfg, args, errfile)
-    test_statuses = []
-    test_obj_list = []
-    for test_id in test_list:
-        try:
-            test = TestRun.load(pav_cfg, test_id)
-            test_obj_list.append(test)
-        except (TestRunError, TestRunNotFoundError) as err:
-            test_statuses.append({
-                'test_id': test_id,
-                'name':    "",
-                'state':   STATES.UNKNOWN,
-                'time':    None,
-                'note':    "Error loading test: {}".format(err),
-            })
-
-    statuses = [status_from_test_obj(pav_cfg, test) for test in test_obj_list]
-
-    if statuses is not None:
-        test_statuses = test_statuses + statuses
+
+    results = _get_statuses(pav_cfg, test_list, "Error loading test: {}")
+
+    # Tests that couldn't be loaded are listed first.
+    test_statuses = [stat for loaded, stat in results if not loaded]
+    test_statuses.extend(stat for loaded, stat in results if loaded)
     return test_statuses
 
 
@@ -1,7 +1,7 @@
-import copy
 import time
 
 from pavilion import commands
+from pavilion import dir_db
 from pavilion.output import fprint
 from pavilion.plugins.commands import status
 from pavilion.status_file import STATES
@@ -55,12 +55,25 @@ class WaitCommand(commands.Command):
             help="Prints entire status on one line."
         )
 
+    # How often to check for newly completed tests.
+    CHECK_INTERVAL = 0.5
+
     def run(self, pav_cfg, args):
 
         # get start time
         start_time = time.time()
 
-        tests = status.get_tests(pav_cfg, args, self.errfile)
+        # The run complete file for each test. Tests that don't exist will
+        # never complete, so we don't wait on them (the final status output
+        # reports them instead).
+        tests_dir = pav_cfg.working_dir/'test_runs'
+        complete_files = {}
+        for test_id in status.get_tests(pav_cfg, args, self.errfile):
+            test_path = dir_db.make_id_path(tests_dir, test_id)
+            if test_path.is_dir():
+                complete_files[test_id] = test_path/TestRun.COMPLETE_FN
+
+        tests = set(complete_files.keys())
 
         # determine timeout time, if there is one
         end_time = None
@@ -70,14 +83,11 @@ class WaitCommand(commands.Command):
         periodic_status_count = 0
         while (len(tests) != 0) and (end_time is None or
                                      time.time() < end_time):
-            # Check which tests have completed or failed and move them to the
-            # final list.
-            temp_tests = copy.deepcopy(tests)
-            for test_id in temp_tests:
-                test_obj = TestRun.load(pav_cfg, test_id)
-                run_complete_file = test_obj.path/'RUN_COMPLETE'
-                if run_complete_file.exists():
-                    tests.remove(test_id)
+            # Check which tests have completed or failed and remove them
+            # from the set of tests we're waiting on.
+            for test_id in list(tests):
+                if complete_files[test_id].exists():
+                    tests.discard(test_id)
 
             # print status every 5 seconds
             if not args.silent:
@@ -111,6 +121,9 @@ class WaitCommand(commands.Command):
 
                     periodic_status_count += 1
 
+            if tests:
+                time.sleep(self.CHECK_INTERVAL)
+
         final_stats = status.get_statuses(pav_cfg, args, self.errfile)
         fprint('\n', file=self.outfile)
         return status.print_status(final_stats, self.outfile, args.json)
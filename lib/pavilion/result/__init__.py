@@ -5,6 +5,7 @@ it contains the functions used to get the base result values, as well as
 resolving result evaluations."""
 
 import json
+import pprint
 import textwrap
 from pathlib import Path
 from typing import IO, Callable, List
@@ -21,7 +22,11 @@ def get_result_logger(log_file: IO[str]) -> Callable[..., None]:
     """Return a result logger function that will write to the given outfile
     and track the indentation level. The logger will take
     the string to log, and an optional lvl argument to change the
-    indent level. If the log file is None, this will silently drop all logs."""
+    indent level. If the log file is None, this will silently drop all logs.
+
+    Messages that aren't strings are pretty printed. That's only done when
+    there's a log file to write to, so callers should pass such objects
+    as is rather than formatting them first."""
 
     log_tab_level = 0
 
@@ -34,6 +39,8 @@ def get_result_logger(log_file: IO[str]) -> Callable[..., None]:
             log_tab_level = lvl
 
         if log_file is not None:
+            if not isinstance(msg, str):
+                msg = pprint.pformat(msg)
             log_file.write(textwrap.indent(msg, "  " * log_tab_level))
             log_file.write('\n')
 
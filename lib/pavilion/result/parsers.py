@@ -4,7 +4,6 @@ to process result parser configurations defined by a test run."""
 import glob
 import inspect
 import logging
-import pprint
 from collections import OrderedDict
 from pathlib import Path
 import textwrap
@@ -553,7 +552,7 @@ configured for that test.
     parser_configs = test.config['result_parse']
 
     log("Got result parser configs:")
-    log(pprint.pformat(parser_configs))
+    log(parser_configs)
     log("---------------")
 
     # A list of keys with duplicates already reported on, so we don't
@@ -757,7 +756,7 @@ configured for that test.
 
                 log("Saved results under '{}' for each file {}."
                     .format("per_file", per_file))
-                log(pprint.pformat(per_dict))
+                log(per_dict)
 
             elif per_file == PER_LIST:
                 # Simply put all results together in a list. Values that
@@ -784,7 +783,7 @@ configured for that test.
                     if value not in EMPTY_VALUES
                 ])
                 log("Saved the file name stems for files that matched.")
-                log(pprint.pformat(results[key]))
+                log(results[key])
 
             elif per_file == PER_FULLNAME_LIST:
                 # Get the filenames from the files that matched.
@@ -794,7 +793,7 @@ configured for that test.
                 ])
 
                 log("Saved the file name for files that matched.")
-                log(pprint.pformat(results[key]))
+                log(results[key])
 
             elif per_file == PER_ALL:
                 results[key] = all(presults.values())
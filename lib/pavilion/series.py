@@ -3,6 +3,8 @@
 import datetime as dt
 import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from pavilion import dir_db
@@ -72,16 +74,16 @@ class TestSeries:
                     .format(series_path, err))
 
             # Create a soft link to the test directory of each test in the
-            # series.
-            for test in tests:
-                link_path = dir_db.make_id_path(self.path, test.id)
+            # series. Each link is a single (often network filesystem)
+            # syscall, so create them concurrently.
+            if tests:
+                workers = min(self.pav_cfg.io_threads, len(tests))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    errors = [err for err in pool.map(self._link_test, tests)
+                              if err is not None]
 
-                try:
-                    link_path.symlink_to(test.path)
-                except OSError as err:
-                    raise TestSeriesError(
-                        "Could not link test '{}' in series at '{}': {}"
-                        .format(test.path, link_path, err))
+                if errors:
+                    raise TestSeriesError('\n'.join(errors))
 
             # Update user.json to record last series run per sys_name
             self._save_series_id()
@@ -92,6 +94,23 @@ class TestSeries:
 
         self._logger = logging.getLogger(self.LOGGER_FMT.format(self._id))
 
+    def _link_test(self, test):
+        """Link the given test's directory into the series directory.
+
+        :param TestRun test: The test to link.
+        :returns: An error message on failure, otherwise None.
+        """
+
+        link_path = dir_db.make_id_path(self.path, test.id)
+
+        try:
+            os.symlink(test.path.as_posix(), link_path.as_posix())
+        except OSError as err:
+            return ("Could not link test '{}' in series at '{}': {}"
+                    .format(test.path, link_path, err))
+
+        return None
+
     @property
     def sid(self):  # pylint: disable=invalid-name
         """Return the series id as a string, with an 's' in the front to
@@ -184,19 +203,27 @@ differentiate it from test ids."""
 
         logger = logging.getLogger(cls.LOGGER_FMT.format(sid))
 
-        tests = []
+        test_ids = []
         for path in dir_db.select(series_path):
             try:
-                test_id = int(path.name)
+                test_ids.append(int(path.name))
             except ValueError:
                 logger.info("Bad test id in series from dir '%s'", path)
-                continue
+
+        def load_test(test_id):
+            """Load the given test, or return None if that fails."""
 
             try:
-                tests.append(TestRun.load(pav_cfg, test_id=test_id))
+                return TestRun.load(pav_cfg, test_id=test_id)
             except TestRunError as err:
                 logger.info("Error loading test %s: %s",
                             test_id, err.args[0])
+                return None
+
+        # Loading tests is IO bound, so load several at once.
+        with ThreadPoolExecutor(max_workers=pav_cfg.io_threads) as pool:
+            tests = [test for test in pool.map(load_test, test_ids)
+                     if test is not None]
 
         return cls(pav_cfg, tests, _id=sid)
 
@@ -213,23 +240,22 @@ differentiate it from test ids."""
         lockfile_path = json_file.with_suffix('.lock')
 
         with LockFile(lockfile_path):
-            data = {}
-            try:
-                with json_file.open('r') as json_series_file:
-                    try:
-                        data = json.load(json_series_file)
-                    except json.decoder.JSONDecodeError:
-                        # File was empty, therefore json couldn't be loaded.
-                        pass
-                with json_file.open('w') as json_series_file:
-                    data[sys_name] = self.sid
-                    json_series_file.write(json.dumps(data))
-
-            except FileNotFoundError:
-                # File hadn't been created yet.
-                with json_file.open('w') as json_series_file:
-                    data[sys_name] = self.sid
-                    json_series_file.write(json.dumps(data))
+            # Read and rewrite the file through a single handle, creating it
+            # if it doesn't exist yet.
+            json_fd = os.open(json_file.as_posix(), os.O_RDWR | os.O_CREAT,
+                              0o666)
+            with os.fdopen(json_fd, 'r+') as json_series_file:
+                try:
+                    data = json.load(json_series_file)
+                except json.decoder.JSONDecodeError:
+                    # File was empty (or new), therefore json couldn't be
+                    # loaded.
+                    data = {}
+
+                data[sys_name] = self.sid
+                json_series_file.seek(0)
+                json_series_file.truncate()
+                json_series_file.write(json.dumps(data))
 
     @classmethod
     def load_user_series_id(cls, pav_cfg):
@@ -242,12 +268,12 @@ differentiate it from test ids."""
         sys_vars = system_variables.get_vars(True)
         sys_name = sys_vars['sys_name']
 
-        if not last_series_fn.exists():
-            return None
         try:
             with last_series_fn.open() as last_series_file:
                 sys_name_series_dict = json.load(last_series_file)
                 return sys_name_series_dict[sys_name].strip()
+        except FileNotFoundError:
+            return None
         except (IOError, OSError, KeyError) as err:
             logger.warning("Failed to read series id file '%s': %s",
                            last_series_fn, err)
@@ -313,8 +339,8 @@ class SeriesInfo:
     def complete(self):
         """True if all tests are complete."""
         if self._complete is None:
-            self._complete = all([(test_path / TestRun.COMPLETE_FN).exists()
-                                  for test_path in self._tests])
+            self._complete = all((test_path / TestRun.COMPLETE_FN).exists()
+                                 for test_path in self._tests)
         return self._complete
 
     @property
@@ -119,11 +119,14 @@ class VarCatElem(yc.CategoryElem):
                             "mode, but provided no values."
                             .format(key=key))
 
-                    # Appending the additional (unique) values
-                    base[bkey] = base.get(bkey, self._sub_elem.type())
+                    # Appending the additional (unique) values. The base
+                    # list is copied first; it's shared with the old config,
+                    # which may be the parent of several other tests.
+                    base_vals = self._sub_elem.type(base.get(bkey) or ())
                     for item in new_vals:
-                        if item not in base[bkey]:
-                            base[bkey].append(item)
+                        if item not in base_vals:
+                            base_vals.append(item)
+                    base[bkey] = base_vals
 
             elif key in old:
                 base[key] = self._sub_elem.merge(old[key], new[key])
@@ -12,7 +12,7 @@ import io
 import logging
 import os
 import re
-from collections import defaultdict
+from collections import defaultdict, deque
 from typing import List, IO, Tuple
 
 import yc_yaml
@@ -63,6 +63,14 @@ class TestConfigResolver:
 
         self.logger = logging.getLogger(__file__)
 
+        # Normalized, raw mode configs by mode name. Every test gets the same
+        # modes, so we only need to find and parse each mode file once.
+        self._mode_cfgs = {}
+
+        # Building a config loader means building the whole config element
+        # tree, so share one for the per-test steps.
+        self._loader = TestConfigLoader()
+
     def build_variable_manager(self, raw_test_cfg):
         """Get all of the different kinds of Pavilion variables into a single
         variable set manager for this test.
@@ -179,7 +187,7 @@ class TestConfigResolver:
                             suites[suite_name]['err'] = err
                             continue
 
-                    base = TestConfigLoader().load_empty()
+                    base = self._loader.load_empty()
 
                     try:
                         suite_cfgs = self.resolve_inheritance(
@@ -233,14 +241,18 @@ class TestConfigResolver:
         if host is None:
             host = self.base_var_man['sys.sys_name']
 
-        raw_tests = self.load_raw_configs(tests, host, modes)
+        # Raw configs are popped off as they're resolved, so each one can be
+        # freed as soon as we're done with it.
+        raw_tests = deque(self.load_raw_configs(tests, host, modes))
+        raw_count = len(raw_tests)
 
         progress = 0
 
         resolved_tests = []
 
         # Apply config overrides.
-        for test_cfg in raw_tests:
+        while raw_tests:
+            test_cfg = raw_tests.popleft()
             # Apply the overrides to each of the config values.
             try:
                 self.apply_overrides(test_cfg, overrides)
@@ -293,7 +305,7 @@ class TestConfigResolver:
                 resolved_tests.append((resolved_config, pvar_man))
 
             if output_file is not None:
-                progress += 1.0/len(raw_tests)
+                progress += 1.0/raw_count
                 output.fprint("Resolving Test Configs: {:.0%}".format(progress),
                               file=output_file, end='\r')
 
@@ -319,7 +331,7 @@ class TestConfigResolver:
         :return: A list of raw test_cfg dictionaries.
         """
 
-        test_config_loader = TestConfigLoader()
+        test_config_loader = self._loader
 
         base_config = test_config_loader.load_empty()
 
@@ -443,23 +455,22 @@ class TestConfigResolver:
 
                 picked_tests.append(all_tests[test_suite][requested_test])
 
-        picked_tests = [
-            self.apply_modes(test_cfg, modes)
-            for test_cfg in picked_tests]
-
         # Get the default configuration for a const result parser.
-        const_elem = TestConfigLoader().find('result_parse.constant.*')
+        const_elem = test_config_loader.find('result_parse.constant.*')
+        default_results = self.pav_cfg.default_results
 
-        # Add the pav_cfg default_result configuration items to each test.
-        for test_cfg in picked_tests:
+        # Apply the modes to each test, and add the pav_cfg default_result
+        # configuration items.
+        for i, test_cfg in enumerate(picked_tests):
+            test_cfg = self.apply_modes(test_cfg, modes)
+            picked_tests[i] = test_cfg
 
             if 'constant' not in test_cfg['result_parse']:
                 test_cfg['result_parse']['constant'] = []
 
-            const_keys = [
-                key for key in test_cfg['result_parse']['constant']]
+            const_keys = set(test_cfg['result_parse']['constant'])
 
-            for key, const in self.pav_cfg.default_results.items():
+            for key, const in default_results.items():
 
                 if key in const_keys:
                     # Don't override any that are already there.
@@ -531,7 +542,7 @@ class TestConfigResolver:
     def apply_host(self, test_cfg, host):
         """Apply the host configuration to the given config."""
 
-        test_config_loader = TestConfigLoader()
+        test_config_loader = self._loader
 
         if host is not None:
             host_cfg_path = self._find_config(CONF_HOST, host)
@@ -577,22 +588,34 @@ class TestConfigResolver:
         :param list modes: A list of mode names.
         """
 
-        test_config_loader = TestConfigLoader()
+        test_config_loader = self._loader
 
         for mode in modes:
-            mode_cfg_path = self._find_config(CONF_MODE, mode)
+            if mode in self._mode_cfgs:
+                mode_cfg_path, mode_cfg = self._mode_cfgs[mode]
+            else:
+                mode_cfg_path = self._find_config(CONF_MODE, mode)
+                mode_cfg = None
 
-            if mode_cfg_path is None:
-                raise TestConfigError(
-                    "Could not find {} config file for {}."
-                    .format(CONF_MODE, mode))
+                if mode_cfg_path is None:
+                    raise TestConfigError(
+                        "Could not find {} config file for {}."
+                        .format(CONF_MODE, mode))
 
             try:
-                with mode_cfg_path.open() as mode_cfg_file:
-                    # Load this mode_config and merge it into the base_config.
-                    test_cfg = test_config_loader.load_merge(test_cfg,
-                                                             mode_cfg_file,
-                                                             partial=True)
+                if mode_cfg is None:
+                    with mode_cfg_path.open() as mode_cfg_file:
+                        mode_cfg = test_config_loader.normalize(
+                            test_config_loader.load_raw(mode_cfg_file))
+                    self._mode_cfgs[mode] = mode_cfg_path, mode_cfg
+
+                # Merge this mode config into the base config. The merged
+                # config may share parts of the mode config, so give it
+                # its own copy.
+                test_cfg = test_config_loader.validate(
+                    test_config_loader.merge(test_cfg,
+                                             copy.deepcopy(mode_cfg)),
+                    partial=True)
             except (IOError, OSError) as err:
                 raise TestConfigError("Could not open mode config '{}': {}"
                                       .format(mode_cfg_path, err))
@@ -620,8 +643,7 @@ class TestConfigResolver:
 
         return test_cfg
 
-    @staticmethod
-    def resolve_inheritance(base_config, suite_cfg, suite_path):
+    def resolve_inheritance(self, base_config, suite_cfg, suite_path):
         """Resolve inheritance between tests in a test suite. There's potential
         for loops in the inheritance hierarchy, so we have to be careful of
         that.
@@ -633,7 +655,7 @@ class TestConfigResolver:
         :rtype: dict(str,dict)
         """
 
-        test_config_loader = TestConfigLoader()
+        test_config_loader = self._loader
 
         # This iterative algorithm recursively resolves the inheritance tree
         # from the root ('__base__') downward. Nodes that have been resolved are
@@ -647,9 +669,9 @@ class TestConfigResolver:
         depended_on_by = defaultdict(list)
         # All the tests for this suite.
         suite_tests = {}
-        # A list of tests whose parent's have had their dependencies
+        # A queue of tests whose parent's have had their dependencies
         # resolved.
-        ready_to_resolve = list()
+        ready_to_resolve = deque()
         if suite_cfg is None:  # Catch null test suites.
             raise TestConfigError("Test Suite {} is empty.".format(suite_path))
         try:
@@ -667,7 +689,7 @@ class TestConfigResolver:
                         .append(test_cfg_name)
 
                 try:
-                    suite_tests[test_cfg_name] = TestConfigLoader()\
+                    suite_tests[test_cfg_name] = test_config_loader\
                         .normalize(test_cfg)
                 except (TypeError, KeyError, ValueError) as err:
                     raise TestConfigError(
@@ -684,7 +706,7 @@ class TestConfigResolver:
         # Resolve all the dependencies
         while ready_to_resolve:
             # Grab a test whose parent's are resolved and the parent test.
-            test_cfg_name = ready_to_resolve.pop(0)
+            test_cfg_name = ready_to_resolve.popleft()
             test_cfg = suite_tests[test_cfg_name]
             parent = suite_tests[test_cfg['inherits_from']]
 
@@ -696,11 +718,9 @@ class TestConfigResolver:
             resolve_cmd_inheritance(suite_tests[test_cfg_name])
 
             # Now all tests that depend on this one are ready to resolve.
-            ready_to_resolve.extend(depended_on_by.get(test_cfg_name, []))
-            # Delete this test from here, for a sanity check to know we
-            # resolved it.
-            if test_cfg_name in depended_on_by:
-                del depended_on_by[test_cfg_name]
+            # Removing them from here also serves as a sanity check to know
+            # we resolved them.
+            ready_to_resolve.extend(depended_on_by.pop(test_cfg_name, []))
 
         # If there's anything with dependencies left, that's bad. It
         # generally means there are cycles in our dependency tree.
@@ -819,7 +839,7 @@ class TestConfigResolver:
         :raises: (ValueError,KeyError)
     """
 
-        config_loader = TestConfigLoader()
+        config_loader = self._loader
 
         for ovr in overrides:
             if '=' not in ovr:
@@ -464,12 +464,6 @@ class TestRun(TestAttributes):
         self.run_tmpl_path = self.path/'run.tmpl'
         self.run_script_path = self.path/'run.sh'
 
-        if _id is None:
-            self._write_script(
-                'run',
-                path=self.run_tmpl_path,
-                config=run_config)
-
         if _id is None:
             self.save_attributes()
             self.status.set(STATES.CREATED, "Test directory setup complete.")
@@ -478,6 +472,13 @@ class TestRun(TestAttributes):
 
         self.skipped = self._get_skipped()  # eval skip.
 
+        # Skipped tests will never run, so they don't need a run template.
+        if _id is None and not self.skipped:
+            self._write_script(
+                'run',
+                path=self.run_tmpl_path,
+                config=run_config)
+
     @classmethod
     def load(cls, pav_cfg, test_id):
         """Load an old TestRun object given a test id.
@@ -854,7 +855,6 @@ of result keys.
     test itself.
 :param IO[str] log_file: The file to save result logs to.
 """
-        import pprint
         if self.finished is None:
             raise RuntimeError(
                 "test.gather_results can't be run unless the test was run"
@@ -873,7 +873,7 @@ of result keys.
         results['return_value'] = run_result
 
         result_log("Base results:", lvl=1)
-        result_log(pprint.pformat(results))
+        result_log(results)
 
         if not regather:
             self.status.set(STATES.RESULTS,
@@ -980,8 +980,10 @@ of result keys.
     def results(self):
         """The test results. Returns a dictionary of basic information
         if the test has no results."""
-        if self.results_path.exists() and (
-                self._results is None or self._results['result'] is None):
+        # Only look for the results file if we don't already have final
+        # results; they won't change once set.
+        if ((self._results is None or self._results['result'] is None)
+                and self.results_path.exists()):
             with self.results_path.open() as results_file:
                 self._results = json.load(results_file)
 
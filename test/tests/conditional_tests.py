@@ -1,4 +1,5 @@
 from pavilion import plugins
+from pavilion.status_file import STATES
 from pavilion import system_variables
 from pavilion import unittest
 from pavilion.test_config import VariableSetManager
@@ -49,9 +50,16 @@ class conditionalTest(unittest.PavTestCase):
         test_cfg['only_if'] = {}
         test_list.append(test_cfg)
 
+        # The status history of a plain, unconditional test.
+        base_test = self._quick_test(cfg=base_cfg)
+        base_states = [stat.state for stat in base_test.status.history()]
+
         # Run all 4 tests, all should have skip equal to false.
         for test_cfg in test_list:
             test = self._quick_test(cfg=test_cfg)
+            self.assertTrue(test.run_tmpl_path.exists())
+            self.assertEqual(
+                [stat.state for stat in test.status.history()], base_states)
             test.run()
             self.assertFalse(test.skipped, msg="None of the tests"
                                                "should be skipped.")
@@ -106,6 +114,9 @@ class conditionalTest(unittest.PavTestCase):
         # Run all 5 tests, all should have skip equal to true.
         for test_cfg in test_list:
             test = self._quick_test(cfg=test_cfg)
+            # Tests skipped at creation never get a run template.
+            self.assertFalse(test.run_tmpl_path.exists())
+            self.assertTrue(test.status.has_state(STATES.SKIPPED))
             test.run()
             self.assertTrue(test.skipped, msg="All tests should be skipped.")
 
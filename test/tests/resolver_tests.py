@@ -135,6 +135,62 @@ class ResolverTests(PavTestCase):
         self.assertEqual(test['variables']['null_base'],
                          ['test'])
 
+        # Extending a variable shouldn't alter the parent's (or a sibling
+        # test's) value.
+        tests = self.resolver.load(
+            tests=['extended.parent', 'extended.child1', 'extended.child2'],
+            host='extended',
+        )
+
+        shared = {test['name']: test['variables']['shared']
+                  for test, _ in tests}
+        self.assertEqual(shared['parent'], ['parent'])
+        self.assertEqual(shared['child1'], ['parent', 'child1'])
+        self.assertEqual(shared['child2'], ['parent', 'child2'])
+
+    def test_mode_reuse(self):
+        """Make sure modes are applied to every test that shares a resolver,
+        and that the merged configs don't share data with each other or with
+        the resolver's cached mode config."""
+
+        test_names = ['extended.parent', 'extended.child1', 'extended.child2']
+
+        tests = self.resolver.load(
+            tests=test_names,
+            host='extended',
+            modes=['extended'],
+        )
+        self.assertEqual(len(tests), 3)
+        for test, _ in tests:
+            self.assertEqual(test['variables']['no_base_mode'], ['mode'])
+            self.assertEqual(test['variables']['single_base'],
+                             ['host', 'mode'])
+
+        raw_tests = self.resolver.load_raw_configs(
+            test_names, 'extended', ['extended'])
+        mode_cfg = copy.deepcopy(self.resolver._mode_cfgs['extended'])
+        orig_vars = copy.deepcopy(raw_tests[1]['variables'])
+
+        # Mutate the mode supplied values of the first test.
+        for key in 'no_base_mode', 'single_base':
+            raw_tests[0]['variables'][key].append('mutated')
+
+        for raw_test in raw_tests[1:]:
+            self.assertEqual(raw_test['variables']['no_base_mode'],
+                             orig_vars['no_base_mode'])
+            self.assertEqual(raw_test['variables']['single_base'],
+                             orig_vars['single_base'])
+        self.assertEqual(self.resolver._mode_cfgs['extended'], mode_cfg)
+
+        # The mode should apply cleanly to later loads, too.
+        tests = self.resolver.load(
+            tests=test_names,
+            host='extended',
+            modes=['extended'],
+        )
+        for test, _ in tests:
+            self.assertEqual(test['variables']['no_base_mode'], ['mode'])
+
     def test_apply_overrides(self):
         """Make sure overrides get applied to test configs correctly."""
 
@@ -2,12 +2,14 @@ import grp
 import os
 import shutil
 import subprocess as sp
+import threading
 
 import yc_yaml as yaml
 from pavilion import config
 from pavilion import dir_db
 from pavilion import plugins
 from pavilion import utils
+from pavilion.permissions import PermissionsManager
 from pavilion.unittest import PavTestCase
 
 
@@ -135,4 +137,55 @@ class SpecificPermsTests(PavTestCase):
                     .format(file, masked_mode, oct(stat.st_mode))
             )
 
-
+    def test_perms_manager_threads(self):
+        """Check that overlapping permission managers across threads restore
+        the original umask once the last one exits, even on errors."""
+
+        def get_umask():
+            umask = os.umask(0)
+            os.umask(umask)
+            return umask
+
+        thread_count = 4
+        barrier = threading.Barrier(thread_count)
+        inner_umasks = []
+        errors = []
+        broken = []
+
+        def bad_set_perms(path):
+            raise OSError("Could not set perms on {}".format(path))
+
+        def use_manager(idx):
+            path = self.working_dir/'perm_mgr_{}'.format(idx)
+            mgr = PermissionsManager(path, None, self.umask, silent=False)
+            if idx % 2:
+                mgr.set_perms = bad_set_perms
+
+            try:
+                with mgr:
+                    path.mkdir()
+                    # Make sure every manager is active before any exit.
+                    barrier.wait(5)
+                    inner_umasks.append(get_umask())
+                    barrier.wait(5)
+            except OSError as err:
+                errors.append(err)
+            except threading.BrokenBarrierError as err:
+                broken.append(err)
+
+        orig_umask = os.umask(0o022)
+        try:
+            threads = [threading.Thread(target=use_manager, args=(i,))
+                       for i in range(thread_count)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(10)
+                self.assertFalse(thread.is_alive())
+
+            self.assertEqual(broken, [])
+            self.assertEqual(inner_umasks, [0o077]*thread_count)
+            self.assertEqual(len(errors), thread_count//2)
+            self.assertEqual(get_umask(), 0o022)
+        finally:
+            os.umask(orig_umask)
@@ -3,8 +3,9 @@ import io
 import os
 from pathlib import Path
 
+from pavilion import dir_db
 from pavilion import plugins
-from pavilion.series import TestSeries
+from pavilion.series import TestSeries, TestSeriesError
 from pavilion.test_config import VariableSetManager
 from pavilion.test_run import TestRunError, TestRun
 from pavilion.unittest import PavTestCase
@@ -234,3 +235,27 @@ class TestRunTests(PavTestCase):
 
         self.assertEqual(series.path, series2.path)
         self.assertEqual(series.sid, series2.sid)
+
+    def test_series_link_errors(self):
+        """Make sure every test link failure is reported together."""
+
+        tests = [self._quick_test(build=False, finalize=False)
+                 for _ in range(3)]
+        series = TestSeries(self.pav_cfg, tests)
+
+        # Linking a test that's already in the series conflicts with its
+        # existing link.
+        err = series._link_test(tests[0])
+        self.assertIsNotNone(err)
+        self.assertIn(str(dir_db.make_id_path(series.path, tests[0].id)), err)
+
+        # Every test given twice should get its own error, in a single
+        # exception.
+        with self.assertRaises(TestSeriesError) as context:
+            TestSeries(self.pav_cfg, tests + tests[:2])
+
+        errors = str(context.exception).split('\n')
+        self.assertEqual(len(errors), 2)
+        for test in tests[:2]:
+            self.assertEqual(
+                len([err for err in errors if str(test.path) in err]), 1)
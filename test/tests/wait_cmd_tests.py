@@ -3,9 +3,13 @@ from pavilion import plugins
 from pavilion.series import TestSeries
 from pavilion.test_config import file_format, VariableSetManager
 from pavilion.unittest import PavTestCase
+from pavilion.status_file import STATES
 from pavilion.test_run import TestRun
 import argparse
 import io
+import json
+import threading
+import time
 
 
 class WaitCmdTests(PavTestCase):
@@ -119,3 +123,37 @@ class WaitCmdTests(PavTestCase):
         arg_list = ['-j', '-t', '1'] + test_str.split()
         args = parser.parse_args(arg_list)
         self.assertEqual(wait_cmd.run(self.pav_cfg, args), 0)
+
+    def test_wait_missing(self):
+        """Make sure waiting on a test that doesn't exist doesn't hold up
+        waiting on tests that do."""
+
+        test = self._quick_test()
+        missing_id = test.id + 1000
+
+        wait_cmd = commands.get_command('wait')
+        wait_cmd.outfile = io.StringIO()
+
+        parser = argparse.ArgumentParser()
+        wait_cmd._setup_arguments(parser)
+        args = parser.parse_args(
+            ['-j', '-s', '-t', '10', str(test.id), str(missing_id)])
+
+        # Complete the test while we're waiting on it.
+        timer = threading.Timer(1, test.set_run_complete)
+        timer.start()
+        start = time.time()
+        try:
+            self.assertEqual(wait_cmd.run(self.pav_cfg, args), 0)
+        finally:
+            timer.join()
+        elapsed = time.time() - start
+
+        self.assertGreaterEqual(elapsed, 1)
+        self.assertLess(elapsed, 10)
+
+        statuses = json.loads(wait_cmd.outfile.getvalue())['statuses']
+        statuses = {stat['test_id']: stat for stat in statuses}
+        self.assertEqual(sorted(statuses.keys()), [test.id, missing_id])
+        self.assertEqual(statuses[missing_id]['state'], STATES.UNKNOWN)
+        self.assertNotEqual(statuses[test.id]['state'], STATES.UNKNOWN)